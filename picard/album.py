@@ -732,13 +732,16 @@ class Album(MetadataItem):
         self._files_count += 1
         if new_album:
             self.update(update_tracks=False)
-            self.add_metadata_images_from_children([file])
+            # While suspended, images get rebuilt from all children afterwards
+            if not self.suspend_metadata_images_update:
+                self.add_metadata_images_from_children([file])
 
     def remove_file(self, track, file, new_album=True):
         self._files_count -= 1
         if new_album:
             self.update(update_tracks=False)
-            self.remove_metadata_images_from_children([file])
+            if not self.suspend_metadata_images_update:
+                self.remove_metadata_images_from_children([file])
 
     @staticmethod
     def _match_files(files, tracks, unmatched_files, threshold=0):
@@ -186,13 +186,15 @@ class ImageListState:
 
     def process_images(self, src_obj_metadata):
         src_dict = src_obj_metadata.images.hash_dict()
+        if self.first_obj or not self.has_common_images:
+            # Nothing to compare with, or already known to differ
+            self.images.update(src_dict)
+            self.first_obj = False
+            return
         prev_len = len(self.images)
         self.images.update(src_dict)
         if len(self.images) != prev_len:
-            if not self.first_obj:
-                self.has_common_images = False
-        if self.first_obj:
-            self.first_obj = False
+            self.has_common_images = False
 
 
 class MetadataItem(QtCore.QObject, Item):
@@ -248,7 +250,7 @@ class MetadataItem(QtCore.QObject, Item):
     def get_sources_metadata_images(sources_metadata):
         images = set()
         for s in sources_metadata:
-            images = images.union(s.images)
+            images.update(s.images)
         return images
 
     def remove_metadata_images_from_children(self, removed_sources):
@@ -304,7 +306,8 @@ class MetadataItem(QtCore.QObject, Item):
 
             updated_images = ImageList(state.images.values())
             metadata = getattr(self, metadata_attr)
-            changed |= set(updated_images.hash_dict()) != set(metadata.images.hash_dict())
+            # Child image lists cache their hash dicts, compare key views without building sets
+            changed |= state.images.keys() != metadata.images.hash_dict().keys()
             metadata.images = updated_images
             metadata.has_common_images = state.has_common_images
 
@@ -615,9 +615,9 @@ class Metadata(MutableMapping):
         if not added_images:
             return False
 
-        current_images = set(self.images)
-        if added_images.isdisjoint(current_images):
-            self.images = ImageList(current_images.union(added_images))
+        # isdisjoint() stops at the first common image, no need to build a set first
+        if added_images.isdisjoint(self.images):
+            self.images = ImageList(added_images.union(self.images))
             self.has_common_images = False
             return True
 
@@ -656,7 +656,7 @@ class Metadata(MutableMapping):
             source_images = set(source_metadata.images)
             if previous_images and common_images and previous_images != source_images:
                 common_images = False
-            previous_images = set(source_metadata.images)  # Remember for next iteration
+            previous_images = source_images  # Remember for next iteration
             removed_images = removed_images.difference(source_images)
             if not removed_images and not common_images:
                 return False  # No images left to remove, abort immediately
@@ -159,6 +159,7 @@ from picard.ui import (
     FONT_FAMILY_MONOSPACE,
     theme,
 )
+from picard.ui.colors import clear_translation_cache
 from picard.ui.mainwindow import MainWindow
 from picard.ui.searchdialog.album import AlbumSearchDialog
 from picard.ui.searchdialog.artist import ArtistSearchDialog
@@ -332,6 +333,7 @@ class Tagger(QtWidgets.QApplication):
             localedir = os.path.join(basedir, 'locale')
         # Must be before config upgrade because upgrade dialogs need to be translated.
         setup_gettext(localedir, config.setting['ui_language'], log.debug)
+        clear_translation_cache()
 
     def _init_webservice(self):
         """Initialize web service/API"""
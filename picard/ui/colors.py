@@ -20,7 +20,8 @@
 # Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
 
 
-from collections import defaultdict
+from functools import lru_cache
+import re
 
 from PyQt6 import QtGui
 
@@ -37,50 +38,74 @@ class UnknownColorException(Exception):
     pass
 
 
+# Format returned by QColor.name()
+_CANONICAL_HEX = re.compile(r'#[0-9a-f]{6}')
+
+
+@lru_cache(maxsize=256)
+def _parse_qcolor(value):
+    """Returns a shared QColor for the given color string, do not modify it"""
+    return QtGui.QColor(value)
+
+
 class ColorDescription:
+    __slots__ = ('title', 'group')
+
     def __init__(self, title, group):
         self.title = title
         self.group = group
 
 
+# Shared group names
+_GRP_ENTITIES = N_("Entities")
+_GRP_OTHERS = N_("Others")
+_GRP_LOGGING = N_("Logging")
+_GRP_PROFILES = N_("Profiles")
+_GRP_TAGS = N_("Tags")
+_GRP_SYNTAX_HIGHLIGHTING = N_("Syntax Highlighting")
+
 _COLOR_DESCRIPTIONS = {
-    'entity_error': ColorDescription(title=N_("Errored entity"), group=N_("Entities")),
-    'entity_pending': ColorDescription(title=N_("Pending entity"), group=N_("Entities")),
-    'entity_saved': ColorDescription(title=N_("Saved entity"), group=N_("Entities")),
-    'first_cover_hl': ColorDescription(title=N_("First cover art"), group=N_("Others")),
-    'log_debug': ColorDescription(title=N_('Log view text (debug)'), group=N_("Logging")),
-    'log_error': ColorDescription(title=N_('Log view text (error)'), group=N_("Logging")),
-    'log_info': ColorDescription(title=N_('Log view text (info)'), group=N_("Logging")),
-    'log_warning': ColorDescription(title=N_('Log view text (warning)'), group=N_("Logging")),
-    'profile_hl_bg': ColorDescription(title=N_("Profile highlight background"), group=N_("Profiles")),
-    'profile_hl_fg': ColorDescription(title=N_("Profile highlight foreground"), group=N_("Profiles")),
-    'row_highlight': ColorDescription(title=N_("Row Highlight"), group=N_("Others")),
-    'tagstatus_added': ColorDescription(title=N_("Tag added"), group=N_("Tags")),
-    'tagstatus_changed': ColorDescription(title=N_("Tag changed"), group=N_("Tags")),
-    'tagstatus_removed': ColorDescription(title=N_("Tag removed"), group=N_("Tags")),
-    'syntax_hl_error': ColorDescription(title=N_("Error syntax highlight"), group=N_("Syntax Highlighting")),
-    'syntax_hl_escape': ColorDescription(title=N_("Escape syntax highlight"), group=N_("Syntax Highlighting")),
-    'syntax_hl_func': ColorDescription(title=N_("Function syntax highlight"), group=N_("Syntax Highlighting")),
-    'syntax_hl_noop': ColorDescription(title=N_("Noop syntax highlight"), group=N_("Syntax Highlighting")),
-    'syntax_hl_special': ColorDescription(title=N_("Special syntax highlight"), group=N_("Syntax Highlighting")),
-    'syntax_hl_unicode': ColorDescription(title=N_("Unicode syntax highlight"), group=N_("Syntax Highlighting")),
-    'syntax_hl_var': ColorDescription(title=N_("Variable syntax highlight"), group=N_("Syntax Highlighting")),
+    'entity_error': ColorDescription(title=N_("Errored entity"), group=_GRP_ENTITIES),
+    'entity_pending': ColorDescription(title=N_("Pending entity"), group=_GRP_ENTITIES),
+    'entity_saved': ColorDescription(title=N_("Saved entity"), group=_GRP_ENTITIES),
+    'first_cover_hl': ColorDescription(title=N_("First cover art"), group=_GRP_OTHERS),
+    'log_debug': ColorDescription(title=N_('Log view text (debug)'), group=_GRP_LOGGING),
+    'log_error': ColorDescription(title=N_('Log view text (error)'), group=_GRP_LOGGING),
+    'log_info': ColorDescription(title=N_('Log view text (info)'), group=_GRP_LOGGING),
+    'log_warning': ColorDescription(title=N_('Log view text (warning)'), group=_GRP_LOGGING),
+    'profile_hl_bg': ColorDescription(title=N_("Profile highlight background"), group=_GRP_PROFILES),
+    'profile_hl_fg': ColorDescription(title=N_("Profile highlight foreground"), group=_GRP_PROFILES),
+    'row_highlight': ColorDescription(title=N_("Row Highlight"), group=_GRP_OTHERS),
+    'tagstatus_added': ColorDescription(title=N_("Tag added"), group=_GRP_TAGS),
+    'tagstatus_changed': ColorDescription(title=N_("Tag changed"), group=_GRP_TAGS),
+    'tagstatus_removed': ColorDescription(title=N_("Tag removed"), group=_GRP_TAGS),
+    'syntax_hl_error': ColorDescription(title=N_("Error syntax highlight"), group=_GRP_SYNTAX_HIGHLIGHTING),
+    'syntax_hl_escape': ColorDescription(title=N_("Escape syntax highlight"), group=_GRP_SYNTAX_HIGHLIGHTING),
+    'syntax_hl_func': ColorDescription(title=N_("Function syntax highlight"), group=_GRP_SYNTAX_HIGHLIGHTING),
+    'syntax_hl_noop': ColorDescription(title=N_("Noop syntax highlight"), group=_GRP_SYNTAX_HIGHLIGHTING),
+    'syntax_hl_special': ColorDescription(title=N_("Special syntax highlight"), group=_GRP_SYNTAX_HIGHLIGHTING),
+    'syntax_hl_unicode': ColorDescription(title=N_("Unicode syntax highlight"), group=_GRP_SYNTAX_HIGHLIGHTING),
+    'syntax_hl_var': ColorDescription(title=N_("Variable syntax highlight"), group=_GRP_SYNTAX_HIGHLIGHTING),
 }
 
 
-_DEFAULT_COLORS = defaultdict(dict)
+_DEFAULT_COLORS = {'dark': {}, 'light': {}}
 
 
 class DefaultColor:
+    __slots__ = ('value', 'description', 'qcolor')
+
     def __init__(self, value, description):
-        qcolor = QtGui.QColor(value)
+        qcolor = _parse_qcolor(value)
+        self.qcolor = qcolor
         self.value = qcolor.name()
         self.description = description
 
 
 def register_color(themes, name, value):
-    description = _COLOR_DESCRIPTIONS.get(name, "FIXME: color desc for %s" % name)
+    description = _COLOR_DESCRIPTIONS.get(name, f"FIXME: color desc for {name}")
     for theme_name in themes:
+        assert theme_name in _DEFAULT_COLORS, f"Unknown theme: {theme_name}"
         _DEFAULT_COLORS[theme_name][name] = DefaultColor(value, description)
 
 
@@ -126,50 +151,68 @@ register_color(_DARK, 'syntax_hl_unicode', '#4BEF1F')
 register_color(_DARK, 'syntax_hl_var', '#FCBB51')
 
 
+# Translated (description, title, group) per (theme name, color key)
+_translated_cache = dict()
+
+
+def clear_translation_cache():
+    """Has to be called when the UI language changes"""
+    _translated_cache.clear()
+
+
 class InterfaceColors:
     def __init__(self, dark_theme=None):
         self._dark_theme = dark_theme
         self.set_default_colors()
 
-    @property
-    def dark_theme(self):
+    def refresh_theme(self):
+        """Resolve theme-dependent values, to be called when the theme may have changed"""
         if self._dark_theme is None:
-            return theme.is_dark_theme
+            self._resolved_theme = theme.is_dark_theme
         else:
-            return self._dark_theme
+            self._resolved_theme = self._dark_theme
+        if self._resolved_theme:
+            self._resolved_theme_name = 'dark'
+            self._resolved_config_key = 'interface_colors_dark'
+        else:
+            self._resolved_theme_name = 'light'
+            self._resolved_config_key = 'interface_colors'
+        self._resolved_defaults = _DEFAULT_COLORS[self._resolved_theme_name]
+
+    @property
+    def dark_theme(self):
+        return self._resolved_theme
 
     @property
     def default_colors(self):
-        if self.dark_theme:
-            return _DEFAULT_COLORS['dark']
-        else:
-            return _DEFAULT_COLORS['light']
+        return self._resolved_defaults
 
     @property
     def _config_key(self):
-        if self.dark_theme:
-            return 'interface_colors_dark'
-        else:
-            return 'interface_colors'
+        return self._resolved_config_key
 
     def set_default_colors(self):
+        self.refresh_theme()
         self._colors = dict()
-        for color_key in self.default_colors:
+        self._qcolors = dict()
+        for color_key in self._resolved_defaults:
             self.set_default_color(color_key)
 
     def set_default_color(self, color_key):
-        color_value = self.default_colors[color_key].value
-        self.set_color(color_key, color_value)
+        default = self._resolved_defaults[color_key]
+        self._set_color_validated(color_key, default.qcolor, default.value)
 
     def set_colors(self, colors_dict):
-        for color_key in self.default_colors:
-            if color_key in colors_dict:
-                color_value = colors_dict[color_key]
+        defaults = self._resolved_defaults
+        for color_key, default in defaults.items():
+            color_value = colors_dict.get(color_key)
+            if color_value is not None and color_value != default.value:
+                self.set_color(color_key, color_value)
             else:
-                color_value = self.default_colors[color_key].value
-            self.set_color(color_key, color_value)
+                self._set_color_validated(color_key, default.qcolor, default.value)
 
     def load_from_config(self):
+        self.refresh_theme()
         config = get_config()
         self.set_colors(config.setting[self._config_key])
 
@@ -182,46 +225,61 @@ class InterfaceColors:
         except KeyError:
             if color_key in self.default_colors:
                 return self.default_colors[color_key].value
-            raise UnknownColorException("Unknown color key: %s" % color_key) from None
+            raise UnknownColorException(f"Unknown color key: {color_key}") from None
 
     def get_qcolor(self, color_key):
-        return QtGui.QColor(self.get_color(color_key))
+        try:
+            return QtGui.QColor(self._qcolors[color_key])
+        except KeyError:
+            return QtGui.QColor(_parse_qcolor(self.get_color(color_key)))
+
+    def _get_translations(self, color_key):
+        cache_key = (self._resolved_theme_name, color_key)
+        try:
+            return _translated_cache[cache_key]
+        except KeyError:
+            description = self._resolved_defaults[color_key].description
+            translations = (_(description), _(description.title), _(description.group))
+            _translated_cache[cache_key] = translations
+            return translations
 
     def get_color_description(self, color_key):
-        return _(self.default_colors[color_key].description)
+        return self._get_translations(color_key)[0]
 
     def get_color_title(self, color_key):
-        return _(self.default_colors[color_key].description.title)
+        return self._get_translations(color_key)[1]
 
     def get_color_group(self, color_key):
-        return _(self.default_colors[color_key].description.group)
+        return self._get_translations(color_key)[2]
 
     def set_color(self, color_key, color_value):
         if color_key in self.default_colors:
-            qcolor = QtGui.QColor(color_value)
-            if not qcolor.isValid():
-                qcolor = QtGui.QColor(self.default_colors[color_key].value)
-            self._colors[color_key] = qcolor.name()
+            qcolor = _parse_qcolor(color_value)
+            if _CANONICAL_HEX.fullmatch(color_value):
+                # Already in QColor.name() format, no need to validate or normalize
+                self._set_color_validated(color_key, qcolor, color_value)
+            elif qcolor.isValid():
+                self._set_color_validated(color_key, qcolor, qcolor.name())
+            else:
+                self.set_default_color(color_key)
         else:
-            raise UnknownColorException("Unknown color key: %s" % color_key)
+            raise UnknownColorException(f"Unknown color key: {color_key}")
+
+    def _set_color_validated(self, color_key, qcolor, color_name):
+        # qcolor has to be valid, and color_name its QColor.name()
+        self._colors[color_key] = color_name
+        self._qcolors[color_key] = qcolor
 
     def save_to_config(self):
         # returns True if user has to be warned about color changes
-        changed = False
+        default_keys = self._resolved_defaults.keys()
+        # old color keys not in defaults are dropped
+        new_conf = {key: color for key, color in self._colors.items() if key in default_keys}
         config = get_config()
         conf = config.setting[self._config_key]
-        for key, color in self._colors.items():
-            if key not in conf:
-                # new color key, not need to warn user
-                conf[key] = color
-            elif color != conf[key]:
-                # color changed
-                conf[key] = color
-                changed = True
-        for key in set(conf) - set(self.default_colors):
-            # old color key, remove
-            del conf[key]
-        config.setting[self._config_key] = conf
+        # new color keys don't need a warning, only changed ones
+        changed = any(key in conf and conf[key] != color for key, color in new_conf.items())
+        config.setting[self._config_key] = new_conf
         return changed
 
 
@@ -50,8 +50,8 @@ from picard.ui.forms.ui_options_interface import Ui_InterfaceOptionsPage
 from picard.ui.options import OptionsPage
 from picard.ui.theme import (
     AVAILABLE_UI_THEMES,
-    OS_SUPPORTS_THEMES,
     UiTheme,
+    os_supports_themes,
 )
 from picard.ui.util import (
     FileDialog,
@@ -133,7 +133,7 @@ class InterfaceOptionsPage(OptionsPage):
         self.ui.starting_directory.toggled.connect(self.ui.starting_directory_browse.setEnabled)
         self.ui.starting_directory_browse.clicked.connect(self.starting_directory_browse)
 
-        if not OS_SUPPORTS_THEMES:
+        if not os_supports_themes():
             self.ui.ui_theme_container.hide()
 
         self.ui.allow_multi_dirs_selection.stateChanged.connect(self.multi_selection_warning)
@@ -58,28 +58,30 @@ from picard.ui.searchdialog import (
 class TrackSearchDialog(SearchDialog):
     dialog_header_state = 'tracksearchdialog_header_state'
 
-    def __init__(self, parent, force_advanced_search=None):
-        self.columns = Columns(
-            (
-                Column(N_("Name"), 'title', width=150),
-                Column(N_("Comment"), '~recordingcomment'),
-                Column(
-                    N_("Length"),
-                    '~length',
-                    sort_type=ColumnSortType.SORTKEY,
-                    sortkey=attrgetter('length'),
-                    align=ColumnAlign.RIGHT,
-                    width=50,
-                ),
-                Column(N_("Artist"), 'artist'),
-                Column(N_("Release"), 'album'),
-                Column(N_("Date"), 'date'),
-                Column(N_("Country"), 'country'),
-                Column(N_("Type"), 'releasetype'),
-                Column(N_("Score"), 'score', sort_type=ColumnSortType.NAT, align=ColumnAlign.RIGHT, width=50),
+    # Columns are not modified after construction, share them between instances
+    columns = Columns(
+        (
+            Column(N_("Name"), 'title', width=150),
+            Column(N_("Comment"), '~recordingcomment'),
+            Column(
+                N_("Length"),
+                '~length',
+                sort_type=ColumnSortType.SORTKEY,
+                sortkey=attrgetter('length'),
+                align=ColumnAlign.RIGHT,
+                width=50,
             ),
-            default_width=100,
-        )
+            Column(N_("Artist"), 'artist'),
+            Column(N_("Release"), 'album'),
+            Column(N_("Date"), 'date'),
+            Column(N_("Country"), 'country'),
+            Column(N_("Type"), 'releasetype'),
+            Column(N_("Score"), 'score', sort_type=ColumnSortType.NAT, align=ColumnAlign.RIGHT, width=50),
+        ),
+        default_width=100,
+    )
+
+    def __init__(self, parent, force_advanced_search=None):
         super().__init__(
             parent,
             N_("Track Search Results"),
@@ -142,8 +144,8 @@ class TrackSearchDialog(SearchDialog):
 
         if self.file_:
             metadata = self.file_.orig_metadata
-            candidates = (metadata.compare_to_track(track, FILE_COMPARISON_WEIGHTS) for track in tracks)
-            tracks = (result.track for result in sort_by_similarity(candidates))
+            results = [metadata.compare_to_track(track, FILE_COMPARISON_WEIGHTS) for track in tracks]
+            tracks = [result.track for result in sort_by_similarity(results)]
 
         del self.search_results[:]  # Clear existing data
         self.parse_tracks(tracks)
@@ -151,36 +153,49 @@ class TrackSearchDialog(SearchDialog):
 
     def display_results(self):
         self.prepare_table()
-        for row, obj in enumerate(self.search_results):
-            track = obj[0]
-            self.table.insertRow(row)
-            for pos, c in enumerate(self.columns):
-                self.set_table_item_value(row, pos, c, track)
+        # Sorting is disabled by prepare_table(), allocate all rows at once
+        # and only repaint once the table is filled
+        self.table.setUpdatesEnabled(False)
+        try:
+            self.table.setRowCount(len(self.search_results))
+            for row, obj in enumerate(self.search_results):
+                track = obj[0]
+                for pos, c in enumerate(self.columns):
+                    self.set_table_item_value(row, pos, c, track)
+        finally:
+            self.table.setUpdatesEnabled(True)
         self.show_table(sort_column='score')
 
     def parse_tracks(self, tracks):
+        # Many releases share the same countries, only format each list once
+        country_cache = {}
         for node in tracks:
+            recording_values = {
+                'score': node['score'],
+                '~recordingcomment': node.get('disambiguation', ''),
+            }
             if 'releases' in node:
                 for rel_node in node['releases']:
                     track = Metadata()
                     recording_to_metadata(node, track)
-                    track['score'] = node['score']
-                    track['~recordingcomment'] = node.get('disambiguation', '')
+                    track.update(recording_values)
                     release_to_metadata(rel_node, track)
                     rg_node = rel_node['release-group']
                     release_group_to_metadata(rg_node, track)
                     countries = countries_from_node(rel_node)
                     if countries:
-                        track['country'] = countries_shortlist(countries)
+                        countries_key = tuple(countries)
+                        if countries_key not in country_cache:
+                            country_cache[countries_key] = countries_shortlist(countries)
+                        track['country'] = country_cache[countries_key]
                     self.search_results.append((track, node))
             else:
                 # This handles the case when no release is associated with a track
                 # i.e. the track is an NAT
                 track = Metadata()
                 recording_to_metadata(node, track)
-                track['score'] = node['score']
-                track["album"] = _("Standalone Recording")
-                track['~recordingcomment'] = node.get('disambiguation', '')
+                track.update(recording_values)
+                track['album'] = _("Standalone Recording")
                 self.search_results.append((track, node))
 
     def accept_event(self, rows):
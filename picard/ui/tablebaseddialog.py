@@ -153,12 +153,21 @@ class SortableTableWidgetItem(QtWidgets.QTableWidgetItem):
     def __init__(self, obj=None):
         super().__init__()
         self._obj = obj
+        # An item stays in the same column, compute its sort key only once
+        self._sortkey = None
+
+    def setText(self, text):
+        self._sortkey = None
+        return super().setText(text)
 
     def __lt__(self, other):
         column = self.column()
         return self.sortkey(column) < other.sortkey(column)
 
     def sortkey(self, column):
+        if self._sortkey is not None:
+            return self._sortkey
+
         this_column = self.tableWidget().parent_dialog.columns[column]
 
         if this_column.sort_type == ColumnSortType.SORTKEY:
@@ -167,6 +176,7 @@ class SortableTableWidgetItem(QtWidgets.QTableWidgetItem):
             sortkey = sort_key(self.text(), numeric=True)
         else:
             sortkey = sort_key(self.text())
+        self._sortkey = sortkey
         return sortkey
 
 
@@ -22,6 +22,10 @@
 
 
 from enum import Enum
+from functools import (
+    cache,
+    lru_cache,
+)
 
 from PyQt6 import (
     QtCore,
@@ -40,6 +44,14 @@ from picard.const.sys import (
 from picard.ui.theme_detect import get_linux_dark_mode_strategies
 
 
+# Palette enum members used when applying palettes
+_GROUP_ALL = QtGui.QPalette.ColorGroup.All
+_GROUP_ACTIVE = QtGui.QPalette.ColorGroup.Active
+_ROLE_BASE = QtGui.QPalette.ColorRole.Base
+_ROLE_HIGHLIGHT = QtGui.QPalette.ColorRole.Highlight
+_ROLE_HIGHLIGHTED_TEXT = QtGui.QPalette.ColorRole.HighlightedText
+_ROLE_LINK = QtGui.QPalette.ColorRole.Link
+
 # DRY: Common dark background color
 DARK_BG_COLOR = QtGui.QColor(51, 51, 51)
 
@@ -64,21 +76,66 @@ DARK_PALETTE_COLORS = {
 }
 
 
-OS_SUPPORTS_THEMES = True
+def _flatten_palette_colors(colors):
+    for key, value in colors.items():
+        if isinstance(key, tuple):
+            group, role = key
+        else:
+            group, role = _GROUP_ALL, key
+        yield group, role, QtGui.QBrush(QtGui.QColor(value))
+
+
+# (group, role, QBrush) triples of DARK_PALETTE_COLORS, ready to be applied.
+# setColor() would create a new solid brush for each color on every call.
+_DARK_PALETTE_BRUSHES = tuple(_flatten_palette_colors(DARK_PALETTE_COLORS))
+
+
+def _apply_dark_palette(palette):
+    set_brush = palette.setBrush
+    for group, role, brush in _DARK_PALETTE_BRUSHES:
+        set_brush(group, role, brush)
+
+
+# Platform modules, only imported when needed, see _load_appkit() and _load_winreg()
 AppKit = None
 winreg = None
-if IS_MACOS:
-    try:
-        import AppKit
-    except ImportError:
-        AppKit = None
 
-    OS_SUPPORTS_THEMES = bool(AppKit) and hasattr(AppKit.NSAppearance, '_darkAquaAppearance')
 
-elif IS_HAIKU:
-    OS_SUPPORTS_THEMES = False
-elif IS_WIN:
-    import winreg
+def _load_appkit():
+    """Import AppKit (macOS only), returns None if not available"""
+    global AppKit
+    if AppKit is None:
+        try:
+            import AppKit as appkit_module
+        except ImportError:
+            return None
+        AppKit = appkit_module
+    return AppKit
+
+
+def _load_winreg():
+    """Import winreg (Windows only)"""
+    global winreg
+    if winreg is None:
+        import winreg as winreg_module
+
+        winreg = winreg_module
+    return winreg
+
+
+@cache
+def os_supports_themes():
+    if IS_MACOS:
+        appkit = _load_appkit()
+        return bool(appkit) and hasattr(appkit.NSAppearance, '_darkAquaAppearance')
+    return not IS_HAIKU
+
+
+def __getattr__(name):
+    # OS_SUPPORTS_THEMES is deprecated, kept for plugins, use os_supports_themes()
+    if name == 'OS_SUPPORTS_THEMES':
+        return os_supports_themes()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # Those are values stored in config file:
@@ -96,6 +153,15 @@ class UiTheme(Enum):
         return cls.DEFAULT
 
 
+_STYLE_SHEET = 'QGroupBox::title { /* PICARD-1206, Qt bug workaround */ }'
+
+
+@lru_cache(maxsize=8)
+def _parse_ui_theme(value):
+    # Unknown values intentionally map to UiTheme.DEFAULT, see UiTheme._missing_()
+    return UiTheme(value)
+
+
 AVAILABLE_UI_THEMES = [UiTheme.DEFAULT]
 if IS_WIN or IS_MACOS:
     AVAILABLE_UI_THEMES.extend([UiTheme.LIGHT, UiTheme.DARK])
@@ -116,68 +182,51 @@ class MacOverrideStyle(QtWidgets.QProxyStyle):
         return super().styleHint(hint, option, widget, returnData)
 
 
+@lru_cache(maxsize=1)
+def _detect_linux_dark_mode_cached(strategies) -> bool:
+    # Iterate through all registered strategies
+    for strategy in strategies:
+        if strategy():
+            return True
+    log.debug("No Linux system dark mode detected, defaulting to light mode.")
+    return False
+
+
+def invalidate_dark_mode_cache():
+    """Forget the detected Linux dark mode, to be called if the system appearance changed"""
+    _detect_linux_dark_mode_cached.cache_clear()
+
+
 class BaseTheme:
     def __init__(self):
         self._dark_theme = False
         self._loaded_config_theme = UiTheme.DEFAULT
-        # Registry of dark mode detection strategies for Linux DEs
-        self._dark_mode_strategies = get_linux_dark_mode_strategies()
-
-    def _detect_linux_dark_mode(self) -> bool:
-        # Iterate through all registered strategies
-        for strategy in self._dark_mode_strategies:
-            if strategy():
-                return True
-        log.debug("No Linux system dark mode detected, defaulting to light mode.")
-        return False
 
     def setup(self, app):
         config = get_config()
         ui_theme = config.setting['ui_theme']
-        self._loaded_config_theme = UiTheme(config.setting['ui_theme'])
-
-        # Use the new fusion style from PyQt6 for a modern and consistent look
-        # across all OSes.
-        if not IS_MACOS and not IS_HAIKU and self._loaded_config_theme != UiTheme.SYSTEM:
-            app.setStyle('Fusion')
-        elif IS_MACOS:
-            app.setStyle(MacOverrideStyle(app.style()))
-
-        app.setStyleSheet(
-            'QGroupBox::title { /* PICARD-1206, Qt bug workaround */ }',
-        )
-
-        palette = QtGui.QPalette(app.palette())
-        base_color = palette.color(QtGui.QPalette.ColorGroup.Active, QtGui.QPalette.ColorRole.Base)
+        self._loaded_config_theme = _parse_ui_theme(ui_theme)
+
+        # Setting style, style sheet or palette invalidates the whole widget tree,
+        # only apply them if they actually change.
+        self._setup_style(app)
+        if app.styleSheet() != _STYLE_SHEET:
+            app.setStyleSheet(_STYLE_SHEET)
+
+        # QPalette is implicitly shared, app.palette() only gets detached
+        # into a real copy once a color gets changed
+        palette = app.palette()
+        base_color = palette.color(_GROUP_ACTIVE, _ROLE_BASE)
         self._dark_theme = base_color.lightness() < 128
         self._accent_color = None
         if self._dark_theme:
-            self._accent_color = palette.color(QtGui.QPalette.ColorGroup.Active, QtGui.QPalette.ColorRole.Highlight)
+            self._accent_color = palette.color(_GROUP_ACTIVE, _ROLE_HIGHLIGHT)
 
-        # Linux-specific: If SYSTEM theme, try to detect system dark mode
-        # Do not apply override if already dark theme
-        is_dark_theme = self.is_dark_theme
-        if (
-            not self._dark_theme
-            and not IS_WIN
-            and not IS_MACOS
-            and not IS_HAIKU
-            and self._loaded_config_theme == UiTheme.SYSTEM
-        ):
-            is_dark_theme = self._detect_linux_dark_mode()
-            if is_dark_theme:
-                # Apply a dark palette centrally defined
-                for key, value in DARK_PALETTE_COLORS.items():
-                    if isinstance(key, tuple):
-                        group, role = key
-                        palette.setColor(group, role, value)
-                    else:
-                        palette.setColor(key, value)
-                self._dark_theme = True
-                self._accent_color = palette.color(QtGui.QPalette.ColorGroup.Active, QtGui.QPalette.ColorRole.Highlight)
-            else:
-                self._dark_theme = False
-                self._accent_color = None
+        if self._loaded_config_theme in {UiTheme.DARK, UiTheme.LIGHT}:
+            # Explicitly configured, no need to detect the system dark mode
+            is_dark_theme = self._loaded_config_theme == UiTheme.DARK
+        else:
+            is_dark_theme = self._update_dark_theme(palette)
 
         accent_color = self.accent_color
         if accent_color:
@@ -194,7 +243,18 @@ class BaseTheme:
         )
 
         self.update_palette(palette, is_dark_theme, accent_color)
-        app.setPalette(palette)
+        if palette != app.palette():
+            app.setPalette(palette)
+
+    def _setup_style(self, app):
+        # Use the new fusion style from PyQt6 for a modern and consistent look
+        # across all OSes.
+        if self._loaded_config_theme != UiTheme.SYSTEM and app.style().objectName().lower() != 'fusion':
+            app.setStyle('Fusion')
+
+    def _update_dark_theme(self, palette):  # pylint: disable=unused-argument
+        """Adjust palette to the system dark mode if needed, returns whether the theme is dark"""
+        return self.is_dark_theme
 
     @property
     def is_dark_theme(self):
@@ -212,31 +272,89 @@ class BaseTheme:
     # pylint: disable=no-self-use
     def update_palette(self, palette, dark_theme, accent_color):
         if accent_color:
-            accent_text_color = (
-                QtCore.Qt.GlobalColor.white if accent_color.lightness() < 160 else QtCore.Qt.GlobalColor.black
-            )
-            palette.setColor(QtGui.QPalette.ColorGroup.Active, QtGui.QPalette.ColorRole.Highlight, accent_color)
-            palette.setColor(
-                QtGui.QPalette.ColorGroup.Active, QtGui.QPalette.ColorRole.HighlightedText, accent_text_color
-            )
+            # Pick text color by BT.601 luma (scaled by 1000) of the accent color
+            r, g, b, _a = accent_color.getRgb()
+            luma = 299 * r + 587 * g + 114 * b
+            accent_text_color = QtCore.Qt.GlobalColor.white if luma < 160000 else QtCore.Qt.GlobalColor.black
+            palette.setColor(_GROUP_ACTIVE, _ROLE_HIGHLIGHT, accent_color)
+            palette.setColor(_GROUP_ACTIVE, _ROLE_HIGHLIGHTED_TEXT, accent_text_color)
 
             link_color = QtGui.QColor()
             link_color.setHsl(accent_color.hue(), accent_color.saturation(), 160, accent_color.alpha())
-            palette.setColor(QtGui.QPalette.ColorRole.Link, link_color)
+            palette.setColor(_ROLE_LINK, link_color)
+
+
+class LinuxTheme(BaseTheme):
+    """Theme for Linux and other Unix desktops, following the system dark mode"""
+
+    def __init__(self):
+        super().__init__()
+        # Registry of dark mode detection strategies for Linux DEs
+        self._dark_mode_strategies = tuple(get_linux_dark_mode_strategies())
+
+    def _detect_linux_dark_mode(self) -> bool:
+        # Strategies are slow (D-Bus calls, subprocesses), detection result is cached
+        return _detect_linux_dark_mode_cached(self._dark_mode_strategies)
+
+    def _update_dark_theme(self, palette):
+        # If SYSTEM theme, try to detect system dark mode
+        # Do not apply override if already dark theme
+        if self._dark_theme or self._loaded_config_theme != UiTheme.SYSTEM:
+            return self.is_dark_theme
+
+        if self._detect_linux_dark_mode():
+            # Apply a dark palette centrally defined
+            _apply_dark_palette(palette)
+            self._dark_theme = True
+            self._accent_color = palette.color(_GROUP_ACTIVE, _ROLE_HIGHLIGHT)
+            return True
+
+        self._dark_theme = False
+        self._accent_color = None
+        return False
+
+
+class HaikuTheme(BaseTheme):
+    """Haiku theme, keeping the native style"""
+
+    def _setup_style(self, app):
+        pass
 
 
 # Move `WindowsTheme` to outside of IS_WIN to enable testing.
 class WindowsTheme(BaseTheme):
     """Windows dark mode theme."""
 
+    def __init__(self):
+        super().__init__()
+        self._clear_registry_cache()
+
+    def _clear_registry_cache(self):
+        # Registry values are read once per setup(), None is a valid accent color
+        self._registry_dark_theme = None
+        self._registry_accent_color = None
+        self._registry_accent_color_read = False
+
     def setup(self, app):
-        app.setStyle('Fusion')
+        self._clear_registry_cache()
         super().setup(app)
 
+    def _setup_style(self, app):
+        # Fusion is used on Windows for all themes, including the system one
+        if app.style().objectName().lower() != 'fusion':
+            app.setStyle('Fusion')
+
     @property
     def is_dark_theme(self):
         if self._loaded_config_theme != UiTheme.DEFAULT:
             return self._loaded_config_theme == UiTheme.DARK
+        if self._registry_dark_theme is None:
+            self._registry_dark_theme = self._read_dark_theme()
+        return self._registry_dark_theme
+
+    @staticmethod
+    def _read_dark_theme():
+        _load_winreg()
         dark_theme = False
         try:
             with winreg.OpenKey(
@@ -250,12 +368,24 @@ class WindowsTheme(BaseTheme):
 
     @property
     def accent_color(self):
+        if not self._registry_accent_color_read:
+            self._registry_accent_color = self._read_accent_color()
+            self._registry_accent_color_read = True
+        return self._registry_accent_color
+
+    @staticmethod
+    def _read_accent_color():
+        _load_winreg()
         accent_color = None
         try:
             with winreg.OpenKey(winreg.HKEY_CURRENT_USER, r"Software\Microsoft\Windows\DWM") as key:
                 accent_color_dword = winreg.QueryValueEx(key, "ColorizationColor")[0]
-                accent_color_hex = '#{:06x}'.format(accent_color_dword & 0xFFFFFF)
-                accent_color = QtGui.QColor(accent_color_hex)
+                # The alpha byte of the 0xAARRGGBB value is ignored
+                accent_color = QtGui.QColor(
+                    (accent_color_dword >> 16) & 0xFF,
+                    (accent_color_dword >> 8) & 0xFF,
+                    accent_color_dword & 0xFF,
+                )
         except OSError:
             log.warning("Failed reading ColorizationColor from registry")
         return accent_color
@@ -264,20 +394,20 @@ class WindowsTheme(BaseTheme):
         # Adapt to Windows 10 color scheme (dark / light theme and accent color)
         super().update_palette(palette, dark_theme, accent_color)
         if dark_theme:
-            for key, value in DARK_PALETTE_COLORS.items():
-                if isinstance(key, tuple):
-                    group, role = key
-                    palette.setColor(group, role, value)
-                else:
-                    palette.setColor(key, value)
+            _apply_dark_palette(palette)
 
 
 if IS_WIN:
     theme = WindowsTheme()
 
 elif IS_MACOS:
-    dark_appearance = False
-    if OS_SUPPORTS_THEMES and AppKit:
+
+    @cache
+    def _detect_mac_dark_appearance():
+        # Has to be called before the application appearance gets set in MacTheme.setup(),
+        # the result is cached for later calls
+        if not os_supports_themes():
+            return False
         # Default procedure to identify the current appearance (theme)
         appearance = AppKit.NSAppearance.currentAppearance()
         try:
@@ -287,22 +417,27 @@ elif IS_MACOS:
                     AppKit.NSAppearanceNameDarkAqua,
                 ]
             )
-            dark_appearance = basic_appearance == AppKit.NSAppearanceNameDarkAqua
         except AttributeError:
-            pass
+            return False
+        return basic_appearance == AppKit.NSAppearanceNameDarkAqua
 
     class MacTheme(BaseTheme):
+        def _setup_style(self, app):
+            # Avoid wrapping the override style again if it is already active
+            if not isinstance(app.style(), MacOverrideStyle):
+                app.setStyle(MacOverrideStyle(app.style()))
+
         def setup(self, app):
             super().setup(app)
 
             if self._loaded_config_theme != UiTheme.DEFAULT:
                 dark_theme = self._loaded_config_theme == UiTheme.DARK
             else:
-                dark_theme = dark_appearance
+                dark_theme = _detect_mac_dark_appearance()
 
             # MacOS uses a NSAppearance object to change the current application appearance
             # We call this even if UiTheme is the default, preventing MacOS from switching on-the-fly
-            if OS_SUPPORTS_THEMES and AppKit:
+            if os_supports_themes():
                 try:
                     if dark_theme:
                         appearance = AppKit.NSAppearance._darkAquaAppearance()
@@ -314,11 +449,11 @@ elif IS_MACOS:
 
         @property
         def is_dark_theme(self):
-            if not OS_SUPPORTS_THEMES:
+            if not os_supports_themes():
                 # Fall back to generic dark color palette detection
                 return super().is_dark_theme
             elif self._loaded_config_theme == UiTheme.DEFAULT:
-                return dark_appearance
+                return _detect_mac_dark_appearance()
             else:
                 return self._loaded_config_theme == UiTheme.DARK
 
@@ -328,8 +463,11 @@ elif IS_MACOS:
 
     theme = MacTheme()
 
+elif IS_HAIKU:
+    theme = HaikuTheme()
+
 else:
-    theme = BaseTheme()
+    theme = LinuxTheme()
 
 
 def setup(app):
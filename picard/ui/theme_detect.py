@@ -36,6 +36,11 @@ from picard.ui.theme_detect_qtdbus import (
 )
 
 
+# Seconds to wait for a settings query tool before giving up on it,
+# a hanging tool must not stall the application startup
+SUBPROCESS_TIMEOUT = 2
+
+
 def gsettings_get(key: str) -> str | None:
     """Get a gsettings value as a string or None."""
     try:
@@ -49,9 +54,10 @@ def gsettings_get(key: str) -> str | None:
             capture_output=True,
             text=True,
             check=True,
+            timeout=SUBPROCESS_TIMEOUT,
         )
         return result.stdout.strip().strip("'\"")
-    except (subprocess.CalledProcessError, FileNotFoundError):
+    except (subprocess.CalledProcessError, subprocess.TimeoutExpired, FileNotFoundError):
         log.debug(f"gsettings get {key} failed.")
         return None
 
@@ -132,12 +138,13 @@ def detect_xfce_dark_theme() -> bool:
             capture_output=True,
             text=True,
             check=True,
+            timeout=SUBPROCESS_TIMEOUT,
         )
         theme = result.stdout.strip().lower()
         if "dark" in theme:
             log.debug(f"Detected XFCE theme: {theme} (dark)")
             return True
-    except (subprocess.CalledProcessError, FileNotFoundError):
+    except (subprocess.CalledProcessError, subprocess.TimeoutExpired, FileNotFoundError):
         log.debug("xfconf-query detection failed.")
     return False
 
@@ -180,6 +187,7 @@ def detect_freedesktop_color_scheme_dark() -> bool:
             capture_output=True,
             text=True,
             check=True,
+            timeout=SUBPROCESS_TIMEOUT,
         )
         value = result.stdout.strip().strip("'\"")
         if value == "1":
@@ -188,7 +196,7 @@ def detect_freedesktop_color_scheme_dark() -> bool:
         if value == "0":
             log.debug("Detected org.freedesktop.appearance.color-scheme: light (0)")
             return False
-    except (subprocess.CalledProcessError, FileNotFoundError):
+    except (subprocess.CalledProcessError, subprocess.TimeoutExpired, FileNotFoundError):
         log.debug("gsettings get org.freedesktop.appearance.color-scheme failed.")
     return False
 
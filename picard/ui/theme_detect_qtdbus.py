@@ -37,6 +37,7 @@ class DBusThemeDetector:
         self.session_bus = None
         self.portal_interface = None
         self.gnome_interface = None
+        self._service_names = None
         self._initialize_dbus()
 
     def _initialize_dbus(self) -> None:
@@ -74,20 +75,21 @@ class DBusThemeDetector:
             if not self.session_bus or not self.session_bus.isConnected():
                 return False
 
-            # List all available services and check if our target is there
-            interface = QDBusInterface(
-                "org.freedesktop.DBus", "/org/freedesktop/DBus", "org.freedesktop.DBus", self.session_bus
-            )
+            # List all available services once, and check if our target is there
+            if self._service_names is None:
+                interface = QDBusInterface(
+                    "org.freedesktop.DBus", "/org/freedesktop/DBus", "org.freedesktop.DBus", self.session_bus
+                )
 
-            reply = interface.call("ListNames")
-            if reply.type() == QDBusMessage.MessageType.ErrorMessage:
-                return False
+                reply = interface.call("ListNames")
+                if reply.type() == QDBusMessage.MessageType.ErrorMessage:
+                    return False
 
-            services = reply.arguments()[0] if reply.arguments() else []
+                self._service_names = frozenset(reply.arguments()[0] if reply.arguments() else ())
         except (RuntimeError, AttributeError, TypeError):
             return False
         else:
-            return service_name in services
+            return service_name in self._service_names
 
     def freedesktop_portal_color_scheme_is_dark(self) -> bool | None:
         """
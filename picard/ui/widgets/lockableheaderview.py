@@ -20,7 +20,10 @@
 # Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
 
 
-from PyQt6 import QtWidgets
+from PyQt6 import (
+    QtCore,
+    QtWidgets,
+)
 
 from picard.i18n import gettext as _
 
@@ -36,26 +39,35 @@ class LockableHeaderView(QtWidgets.QHeaderView):
     def __init__(self, orientation, parent=None):
         super().__init__(orientation, parent=parent)
         self.prelock_state = None
+        self._locked_tooltip = None
         self.lock(False)
 
+    def changeEvent(self, event):
+        if event.type() == QtCore.QEvent.Type.LanguageChange:
+            self._locked_tooltip = None
+        super().changeEvent(event)
+
     def mouseReleaseEvent(self, event):
-        if self.is_locked:
-            tooltip = _(
+        # Normal handling of events, shadowed by _locked_mouse_release() while locked.
+        # This has to stay defined on the class, as PyQt caches missing overrides.
+        super().mouseReleaseEvent(event)
+
+    def _locked_mouse_release(self, event):
+        if self._locked_tooltip is None:
+            self._locked_tooltip = _(
                 "The table is locked. To enable sorting and column resizing\n"
                 "unlock the table in the table header's context menu."
             )
-            QtWidgets.QToolTip.showText(event.globalPosition().toPoint(), tooltip, self)
-            return
-
-        # Normal handling of events
-        super().mouseReleaseEvent(event)
+        QtWidgets.QToolTip.showText(event.globalPosition().toPoint(), self._locked_tooltip, self)
 
     def lock(self, is_locked):
         self.is_locked = is_locked
         if is_locked:
             self.prelock_state = self.saveState()
             self.setSectionResizeMode(QtWidgets.QHeaderView.ResizeMode.Fixed)
+            self.mouseReleaseEvent = self._locked_mouse_release
         else:
+            vars(self).pop('mouseReleaseEvent', None)
             if self.prelock_state is not None:
                 self.restoreState(self.prelock_state)
                 self.prelock_state = None
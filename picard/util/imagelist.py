@@ -24,16 +24,30 @@
 # Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
 
 
+from collections import Counter
 from collections.abc import MutableSequence
 
 from picard.config import get_config
 
 
+class _NotSet:
+    # Keep the sentinel identity when image lists get copied or pickled
+    def __reduce__(self):
+        return '_NOT_SET'
+
+
+_NOT_SET = _NotSet()
+
+
 class ImageList(MutableSequence):
+    __slots__ = ('_images', '_hash_dict', '_dirty', '_front_image', '_saved_front_image')
+
     def __init__(self, iterable=()):
         self._images = list(iterable)
         self._hash_dict = {}
         self._dirty = True
+        self._front_image = _NOT_SET
+        self._saved_front_image = _NOT_SET
 
     def __len__(self):
         return len(self._images)
@@ -44,58 +58,91 @@ class ImageList(MutableSequence):
     def __setitem__(self, index, value):
         if self._images[index] != value:
             self._images[index] = value
-            self._dirty = True
+            self._changed()
 
     def __delitem__(self, index):
         del self._images[index]
-        self._dirty = True
+        self._changed()
 
     def insert(self, index, value):
         self._images.insert(index, value)
+        self._changed()
+
+    def __contains__(self, value):
+        datahash = getattr(value, 'datahash', None)
+        if datahash is not None:
+            try:
+                hashes = self.hash_dict()
+            except AttributeError:
+                # Not all entries have data yet, only a full scan can tell
+                hashes = None
+            # Equal images share their data, so a missing hash rules out a match
+            if hashes is not None and datahash.hash() not in hashes:
+                return False
+        return value in self._images
+
+    def _changed(self):
         self._dirty = True
+        self._front_image = _NOT_SET
+        self._saved_front_image = _NOT_SET
 
     def __repr__(self):
         return '%s(%r)' % (self.__class__.__name__, self._images)
 
-    def _sorted(self):
-        return sorted(self, key=lambda image: image.normalized_types())
-
     def __eq__(self, other):
         if len(self) != len(other):
             return False
-        return self._sorted() == other._sorted()
+        # Order independent comparison, images hash by their data
+        return Counter(self._images) == Counter(other)
 
     def copy(self):
         return self.__class__(self._images)
 
     def get_front_image(self):
-        for img in self:
-            if img.is_front_image():
-                return img
-        return None
+        # Cached until the list changes
+        if self._front_image is _NOT_SET:
+            self._front_image = next((img for img in self._images if img.is_front_image()), None)
+        return self._front_image
 
     def to_be_saved_to_tags(self, settings=None):
         """Generator returning images to be saved to tags according to
         passed settings or config.setting
+
+        With `embed_only_one_front_image` set only the first front image
+        is yielded, it is looked up once and cached until the list changes.
         """
         if settings is None:
             config = get_config()
             settings = config.setting
         if settings['save_images_to_tags']:
-            only_one_front = settings['embed_only_one_front_image']
-            for image in self:
-                if not image.can_be_saved_to_tags:
-                    continue
-                if only_one_front:
-                    if image.is_front_image():
+            if settings['embed_only_one_front_image']:
+                front_image = self._front_image_to_be_saved()
+                if front_image is not None:
+                    yield front_image
+            else:
+                for image in self:
+                    if image.can_be_saved_to_tags:
                         yield image
-                        break
-                else:
-                    yield image
+
+    def _front_image_to_be_saved(self):
+        # Cached until the list changes, the same images get saved to many files
+        if self._saved_front_image is _NOT_SET:
+            self._saved_front_image = next(
+                (image for image in self._images if image.can_be_saved_to_tags and image.is_front_image()),
+                None,
+            )
+        return self._saved_front_image
+
+    def delete_where(self, predicate):
+        """Remove all images for which `predicate(image)` is true, in a single pass"""
+        images = [image for image in self._images if not predicate(image)]
+        # Keep the cached hash dict valid if there was nothing to remove
+        if len(images) != len(self._images):
+            self._images = images
+            self._changed()
 
     def strip_front_images(self):
-        self._images = [image for image in self._images if not image.is_front_image()]
-        self._dirty = True
+        self.delete_where(lambda image: image.is_front_image())
 
     def hash_dict(self):
         if self._dirty:
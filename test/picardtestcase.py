@@ -22,6 +22,7 @@
 # Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
 
 
+from functools import lru_cache
 import json
 import logging
 import os
@@ -136,6 +137,7 @@ def get_test_data_path(*paths):
     return os.path.join('test', 'data', *paths)
 
 
+@lru_cache(maxsize=64)
 def create_fake_png(extra):
     """Creates fake PNG data that satisfies Picard's internal image type detection"""
     return b'\x89PNG\x0d\x0a\x1a\x0a' + (b'a' * 4) + b'IHDR' + struct.pack('>LL', 100, 100) + extra
@@ -53,53 +53,62 @@ def create_test_files():
     return (test_images, test_files)
 
 
-class UpdateMetadataImagesTest(PicardTestCase):
+class MetadataImagesTestCase(PicardTestCase):
+    # Images can't be shared between tests, their data files are removed
+    # by the tagger cleanup after each test
     def setUp(self):
         super().setUp()
         (self.test_images, self.test_files) = create_test_files()
+        self.shared_images = self.test_images[1:]  # images of test files 1 and 2
 
+    def assertImagesEqual(self, expected, images):
+        # Order independent, does not rely on ImageList.__eq__
+        self.assertCountEqual(expected, images)
+
+
+class UpdateMetadataImagesTest(MetadataImagesTestCase):
     def test_update_cluster_images(self):
         cluster = Cluster('Test')
         cluster.files = list(self.test_files)
         self.assertTrue(cluster.update_metadata_images_from_children())
-        self.assertEqual(set(self.test_images), set(cluster.metadata.images))
+        self.assertImagesEqual(self.test_images, cluster.metadata.images)
         self.assertFalse(cluster.metadata.has_common_images)
 
         cluster.files.remove(self.test_files[2])
         self.assertFalse(cluster.update_metadata_images_from_children())
-        self.assertEqual(set(self.test_images), set(cluster.metadata.images))
+        self.assertImagesEqual(self.test_images, cluster.metadata.images)
         self.assertFalse(cluster.metadata.has_common_images)
 
         cluster.files.remove(self.test_files[0])
         self.assertTrue(cluster.update_metadata_images_from_children())
-        self.assertEqual(set(self.test_images[1:]), set(cluster.metadata.images))
+        self.assertImagesEqual(self.shared_images, cluster.metadata.images)
         self.assertTrue(cluster.metadata.has_common_images)
 
         cluster.files.append(self.test_files[2])
         self.assertFalse(cluster.update_metadata_images_from_children())
-        self.assertEqual(set(self.test_images[1:]), set(cluster.metadata.images))
+        self.assertImagesEqual(self.shared_images, cluster.metadata.images)
         self.assertTrue(cluster.metadata.has_common_images)
 
     def test_update_track_images(self):
         track = Track('00000000-0000-0000-0000-000000000000')
         track.files = list(self.test_files)
         self.assertTrue(track.update_metadata_images_from_children())
-        self.assertEqual(set(self.test_images), set(track.orig_metadata.images))
+        self.assertImagesEqual(self.test_images, track.orig_metadata.images)
         self.assertFalse(track.orig_metadata.has_common_images)
 
         track.files.remove(self.test_files[2])
         self.assertFalse(track.update_metadata_images_from_children())
-        self.assertEqual(set(self.test_images), set(track.orig_metadata.images))
+        self.assertImagesEqual(self.test_images, track.orig_metadata.images)
         self.assertFalse(track.orig_metadata.has_common_images)
 
         track.files.remove(self.test_files[0])
         self.assertTrue(track.update_metadata_images_from_children())
-        self.assertEqual(set(self.test_images[1:]), set(track.orig_metadata.images))
+        self.assertImagesEqual(self.shared_images, track.orig_metadata.images)
         self.assertTrue(track.orig_metadata.has_common_images)
 
         track.files.append(self.test_files[2])
         self.assertFalse(track.update_metadata_images_from_children())
-        self.assertEqual(set(self.test_images[1:]), set(track.orig_metadata.images))
+        self.assertImagesEqual(self.shared_images, track.orig_metadata.images)
         self.assertTrue(track.orig_metadata.has_common_images)
 
     def test_update_album_images(self):
@@ -111,46 +120,42 @@ class UpdateMetadataImagesTest(PicardTestCase):
         album.tracks = [track1, track2]
         album.unmatched_files.files.append(self.test_files[2])
         self.assertTrue(album.update_metadata_images_from_children())
-        self.assertEqual(set(self.test_images), set(album.orig_metadata.images))
+        self.assertImagesEqual(self.test_images, album.orig_metadata.images)
         self.assertFalse(album.orig_metadata.has_common_images)
 
         album.tracks.remove(track2)
         self.assertFalse(album.update_metadata_images_from_children())
-        self.assertEqual(set(self.test_images), set(album.orig_metadata.images))
+        self.assertImagesEqual(self.test_images, album.orig_metadata.images)
         self.assertFalse(album.orig_metadata.has_common_images)
 
         album.tracks.remove(track1)
         self.assertTrue(album.update_metadata_images_from_children())
-        self.assertEqual(set(self.test_images[1:]), set(album.orig_metadata.images))
+        self.assertImagesEqual(self.shared_images, album.orig_metadata.images)
         self.assertTrue(album.orig_metadata.has_common_images)
 
         album.tracks.append(track2)
         self.assertFalse(album.update_metadata_images_from_children())
-        self.assertEqual(set(self.test_images[1:]), set(album.orig_metadata.images))
+        self.assertImagesEqual(self.shared_images, album.orig_metadata.images)
         self.assertTrue(album.orig_metadata.has_common_images)
 
 
-class RemoveMetadataImagesTest(PicardTestCase):
-    def setUp(self):
-        super().setUp()
-        (self.test_images, self.test_files) = create_test_files()
-
+class RemoveMetadataImagesTest(MetadataImagesTestCase):
     def test_remove_from_cluster(self):
         cluster = Cluster('Test')
         cluster.files = list(self.test_files)
         self.assertTrue(cluster.update_metadata_images_from_children())
         cluster.files.remove(self.test_files[0])
         self.assertTrue(cluster.remove_metadata_images_from_children([self.test_files[0]]))
-        self.assertEqual(set(self.test_images[1:]), set(cluster.metadata.images))
+        self.assertImagesEqual(self.shared_images, cluster.metadata.images)
         self.assertTrue(cluster.metadata.has_common_images)
 
     def test_remove_from_cluster_with_common_images(self):
         cluster = Cluster('Test')
-        cluster.files = list(self.test_files[1:])
+        cluster.files = self.test_files[1:]
         self.assertTrue(cluster.update_metadata_images_from_children())
         cluster.files.remove(self.test_files[1])
         self.assertFalse(cluster.remove_metadata_images_from_children([self.test_files[1]]))
-        self.assertEqual(set(self.test_images[1:]), set(cluster.metadata.images))
+        self.assertImagesEqual(self.shared_images, cluster.metadata.images)
         self.assertTrue(cluster.metadata.has_common_images)
 
     def test_remove_from_empty_cluster(self):
@@ -158,7 +163,7 @@ class RemoveMetadataImagesTest(PicardTestCase):
         cluster.files.append(File('test1.flac'))
         self.assertFalse(cluster.update_metadata_images_from_children())
         self.assertFalse(cluster.remove_metadata_images_from_children([cluster.files[0]]))
-        self.assertEqual(set(), set(cluster.metadata.images))
+        self.assertImagesEqual([], cluster.metadata.images)
         self.assertTrue(cluster.metadata.has_common_images)
 
     def test_remove_from_track(self):
@@ -167,16 +172,16 @@ class RemoveMetadataImagesTest(PicardTestCase):
         self.assertTrue(track.update_metadata_images_from_children())
         track.files.remove(self.test_files[0])
         self.assertTrue(track.remove_metadata_images_from_children([self.test_files[0]]))
-        self.assertEqual(set(self.test_images[1:]), set(track.orig_metadata.images))
+        self.assertImagesEqual(self.shared_images, track.orig_metadata.images)
         self.assertTrue(track.orig_metadata.has_common_images)
 
     def test_remove_from_track_with_common_images(self):
         track = Track('00000000-0000-0000-0000-000000000000')
-        track.files = list(self.test_files[1:])
+        track.files = self.test_files[1:]
         self.assertTrue(track.update_metadata_images_from_children())
         track.files.remove(self.test_files[1])
         self.assertFalse(track.remove_metadata_images_from_children([self.test_files[1]]))
-        self.assertEqual(set(self.test_images[1:]), set(track.orig_metadata.images))
+        self.assertImagesEqual(self.shared_images, track.orig_metadata.images)
         self.assertTrue(track.orig_metadata.has_common_images)
 
     def test_remove_from_empty_track(self):
@@ -184,7 +189,7 @@ class RemoveMetadataImagesTest(PicardTestCase):
         track.files.append(File('test1.flac'))
         self.assertFalse(track.update_metadata_images_from_children())
         self.assertFalse(track.remove_metadata_images_from_children([track.files[0]]))
-        self.assertEqual(set(), set(track.orig_metadata.images))
+        self.assertImagesEqual([], track.orig_metadata.images)
         self.assertTrue(track.orig_metadata.has_common_images)
 
     def test_remove_from_album(self):
@@ -193,19 +198,19 @@ class RemoveMetadataImagesTest(PicardTestCase):
         self.assertTrue(album.update_metadata_images_from_children())
         album.unmatched_files.files.remove(self.test_files[0])
         self.assertTrue(album.remove_metadata_images_from_children([self.test_files[0]]))
-        self.assertEqual(set(self.test_images[1:]), set(album.metadata.images))
-        self.assertEqual(set(self.test_images[1:]), set(album.orig_metadata.images))
+        self.assertImagesEqual(self.shared_images, album.metadata.images)
+        self.assertImagesEqual(self.shared_images, album.orig_metadata.images)
         self.assertTrue(album.metadata.has_common_images)
         self.assertTrue(album.orig_metadata.has_common_images)
 
     def test_remove_from_album_with_common_images(self):
         album = Album('00000000-0000-0000-0000-000000000000')
-        album.unmatched_files.files = list(self.test_files[1:])
+        album.unmatched_files.files = self.test_files[1:]
         self.assertTrue(album.update_metadata_images_from_children())
         album.unmatched_files.files.remove(self.test_files[1])
         self.assertFalse(album.remove_metadata_images_from_children([self.test_files[1]]))
-        self.assertEqual(set(self.test_images[1:]), set(album.metadata.images))
-        self.assertEqual(set(self.test_images[1:]), set(album.orig_metadata.images))
+        self.assertImagesEqual(self.shared_images, album.metadata.images)
+        self.assertImagesEqual(self.shared_images, album.orig_metadata.images)
         self.assertTrue(album.metadata.has_common_images)
         self.assertTrue(album.orig_metadata.has_common_images)
 
@@ -214,24 +219,20 @@ class RemoveMetadataImagesTest(PicardTestCase):
         album.unmatched_files.files.append(File('test1.flac'))
         self.assertFalse(album.update_metadata_images_from_children())
         self.assertFalse(album.remove_metadata_images_from_children([album.unmatched_files.files[0]]))
-        self.assertEqual(set(), set(album.metadata.images))
-        self.assertEqual(set(), set(album.orig_metadata.images))
+        self.assertImagesEqual([], album.metadata.images)
+        self.assertImagesEqual([], album.orig_metadata.images)
         self.assertTrue(album.metadata.has_common_images)
         self.assertTrue(album.orig_metadata.has_common_images)
 
 
-class AddMetadataImagesTest(PicardTestCase):
-    def setUp(self):
-        super().setUp()
-        (self.test_images, self.test_files) = create_test_files()
-
+class AddMetadataImagesTest(MetadataImagesTestCase):
     def test_add_to_cluster(self):
         cluster = Cluster('Test')
         cluster.files = [self.test_files[0]]
         self.assertTrue(cluster.update_metadata_images_from_children())
-        cluster.files += self.test_files[1:]
+        cluster.files.extend(self.test_files[1:])
         self.assertTrue(cluster.add_metadata_images_from_children(self.test_files[1:]))
-        self.assertEqual(set(self.test_images), set(cluster.metadata.images))
+        self.assertImagesEqual(self.test_images, cluster.metadata.images)
         self.assertFalse(cluster.metadata.has_common_images)
 
     def test_add_no_changes(self):
@@ -239,7 +240,7 @@ class AddMetadataImagesTest(PicardTestCase):
         cluster.files = self.test_files
         self.assertTrue(cluster.update_metadata_images_from_children())
         self.assertFalse(cluster.add_metadata_images_from_children([self.test_files[1]]))
-        self.assertEqual(set(self.test_images), set(cluster.metadata.images))
+        self.assertImagesEqual(self.test_images, cluster.metadata.images)
 
     def test_add_nothing(self):
         cluster = Cluster('Test')
@@ -247,6 +248,15 @@ class AddMetadataImagesTest(PicardTestCase):
         self.assertTrue(cluster.update_metadata_images_from_children())
         self.assertFalse(cluster.add_metadata_images_from_children([]))
 
+    def test_add_to_suspended_album(self):
+        album = Album('00000000-0000-0000-0000-000000000000')
+        with album.suspend_metadata_images_update:
+            album.unmatched_files.files.append(self.test_files[0])
+            album.add_file(None, self.test_files[0])
+            self.assertImagesEqual([], album.orig_metadata.images)
+        self.assertTrue(album.update_metadata_images_from_children())
+        self.assertImagesEqual(self.test_images[:1], album.orig_metadata.images)
+
 
 class ImageListTest(PicardTestCase):
     def setUp(self):
@@ -289,10 +299,38 @@ class ImageListTest(PicardTestCase):
         self.assertEqual(list1, list2)
         self.assertNotEqual(list1, list3)
 
+    def test_eq_same_types(self):
+        image_d = CoverArtImage(
+            url='file://filed',
+            data=create_fake_png(b'd'),
+            types=["booklet"],
+            support_types=True,
+            support_multi_types=True,
+        )
+        list1 = ImageList([self.images['a'], image_d])
+        list2 = ImageList([image_d, self.images['a']])
+        self.assertEqual(list1, list2)
+        self.assertNotEqual(list1, ImageList([self.images['a'], self.images['a']]))
+
+    def test_contains(self):
+        self.imagelist.append(self.images['a'])
+        self.assertIn(self.images['a'], self.imagelist)
+        self.assertNotIn(self.images['b'], self.imagelist)
+
+    def test_contains_without_data(self):
+        # No data hash for the second image, the lookup has to scan the list
+        self.imagelist.append(self.images['a'])
+        self.imagelist.append(CoverArtImage(url='file://filenodata'))
+        self.assertIn(self.images['a'], self.imagelist)
+
     def test_get_front_image(self):
         self.imagelist.append(self.images['a'])
         self.imagelist.append(self.images['b'])
         self.assertEqual(self.imagelist.get_front_image(), self.images['b'])
+        self.imagelist.insert(0, self.images['c'])
+        self.assertEqual(self.imagelist.get_front_image(), self.images['c'])
+        self.imagelist.strip_front_images()
+        self.assertIsNone(self.imagelist.get_front_image())
 
     def test_to_be_saved_to_tags(self):
         def to_be_saved(settings):
@@ -330,6 +368,20 @@ class ImageListTest(PicardTestCase):
         with self.assertRaises(KeyError):
             next(to_be_saved(settings))
 
+    def test_to_be_saved_to_tags_front_image_changes(self):
+        settings = {
+            "save_images_to_tags": True,
+            "embed_only_one_front_image": True,
+        }
+        self.imagelist.append(self.images['a'])
+        self.assertEqual(list(self.imagelist.to_be_saved_to_tags(settings=settings)), [])
+        self.imagelist.append(self.images['c'])
+        self.assertEqual(list(self.imagelist.to_be_saved_to_tags(settings=settings)), [self.images['c']])
+        self.imagelist.insert(0, self.images['b'])
+        self.assertEqual(list(self.imagelist.to_be_saved_to_tags(settings=settings)), [self.images['b']])
+        del self.imagelist[0]
+        self.assertEqual(list(self.imagelist.to_be_saved_to_tags(settings=settings)), [self.images['c']])
+
     def test_strip_front_images(self):
         self.imagelist.append(self.images['a'])
         self.imagelist.append(self.images['b'])
@@ -343,6 +395,13 @@ class ImageListTest(PicardTestCase):
         self.assertIn(self.images['a'], self.imagelist)
         self.assertEqual(len(self.imagelist), 1)
 
+    def test_strip_front_images_no_front(self):
+        self.imagelist.append(self.images['a'])
+        self.imagelist.hash_dict()
+        self.imagelist.strip_front_images()
+        self.assertEqual(list(self.imagelist), [self.images['a']])
+        self.assertFalse(self.imagelist._dirty)
+
     def test_imagelist_insert(self):
         imagelist = ImageList()
         imagelist.insert(0, 'a')
@@ -365,6 +424,11 @@ class ImageListTest(PicardTestCase):
         self.assertEqual(imagelist2[0], 'a')
         self.assertEqual(imagelist3[0], 'c')
 
+    def test_imagelist_delete_where(self):
+        imagelist = ImageList(['a', 'b', 'c', 'b'])
+        imagelist.delete_where(lambda image: image == 'b')
+        self.assertEqual(list(imagelist), ['a', 'c'])
+
     def test_imagelist_del(self):
         imagelist = ImageList(['a', 'b'])
         del imagelist[0]
@@ -27,8 +27,10 @@ from test.picardtestcase import PicardTestCase
 from picard import config
 
 from picard.ui.colors import (
+    DefaultColor,
     InterfaceColors,
     UnknownColorException,
+    clear_translation_cache,
     interface_colors,
 )
 
@@ -70,5 +72,66 @@ class InterfaceColorsTest(PicardTestCase):
             )
             self.assertEqual(interface_colors.get_qcolor('entity_error'), QColor('#000000'))
 
+    def test_get_qcolor_returns_copy(self):
+        interface_colors = InterfaceColors(dark_theme=False)
+        qcolor = interface_colors.get_qcolor('entity_error')
+        self.assertEqual(qcolor, QColor(interface_colors.default_colors['entity_error'].value))
+        qcolor.setRed(0)
+        self.assertNotEqual(interface_colors.get_qcolor('entity_error'), qcolor)
+
+    def test_set_colors(self):
+        interface_colors = InterfaceColors(dark_theme=False)
+        default_colors = interface_colors.default_colors
+        interface_colors.set_colors(
+            {
+                'entity_error': 'invalidcolor',
+                'entity_saved': '#123456',
+                'entity_pending': '#abcdef\n',
+            }
+        )
+        self.assertEqual(interface_colors.get_color('entity_error'), default_colors['entity_error'].value)
+        self.assertEqual(interface_colors.get_color('entity_saved'), '#123456')
+        self.assertEqual(interface_colors.get_color('entity_pending'), default_colors['entity_pending'].value)
+        self.assertEqual(interface_colors.get_qcolor('entity_saved'), QColor('#123456'))
+
+    def test_set_color_normalized(self):
+        interface_colors = InterfaceColors(dark_theme=False)
+        interface_colors.set_color('entity_error', '#ABCDEF')
+        self.assertEqual(interface_colors.get_color('entity_error'), '#abcdef')
+        interface_colors.set_color('entity_error', 'red')
+        self.assertEqual(interface_colors.get_color('entity_error'), '#ff0000')
+        interface_colors.set_color('entity_error', '#123456')
+        self.assertEqual(interface_colors.get_color('entity_error'), '#123456')
+        self.assertEqual(interface_colors.get_qcolor('entity_error'), QColor('#123456'))
+        # Not canonical because of trailing whitespace, and not a valid color
+        default_value = interface_colors.default_colors['entity_error'].value
+        for value in ('#abcdef\n', '#abcdef '):
+            interface_colors.set_color('entity_error', value)
+            self.assertEqual(interface_colors.get_color('entity_error'), default_value)
+            self.assertTrue(interface_colors.get_qcolor('entity_error').isValid())
+
+    def test_default_color(self):
+        for value, expected in (('#C80000', '#c80000'), ('darkCyan', '#008b8b'), ('#FFF', '#ffffff')):
+            default = DefaultColor(value, None)
+            self.assertEqual(default.value, expected)
+            self.assertEqual(default.qcolor, QColor(value))
+
+    def test_save_to_config_unchanged(self):
+        interface_colors = InterfaceColors(dark_theme=False)
+        interface_colors.load_from_config()
+        # only new keys are added, and unknown keys removed, no warning
+        self.assertFalse(interface_colors.save_to_config())
+        self.assertEqual(config.setting['interface_colors'], interface_colors.get_colors())
+        self.assertFalse(interface_colors.save_to_config())
+
+    def test_color_title_and_group(self):
+        clear_translation_cache()
+        interface_colors = InterfaceColors(dark_theme=True)
+        self.assertEqual(interface_colors.get_color_title('log_error'), 'Log view text (error)')
+        self.assertEqual(interface_colors.get_color_group('log_error'), 'Logging')
+        # cached values
+        self.assertEqual(interface_colors.get_color_title('log_error'), 'Log view text (error)')
+        self.assertEqual(interface_colors.get_color_group('log_error'), 'Logging')
+
     def test_interface_colors_default(self):
         self.assertIsInstance(interface_colors, InterfaceColors)
@@ -67,26 +67,48 @@ class DummyPalette(QtGui.QPalette):
             )
 
 
+class DummyStyle:
+    """A dummy style only providing its name."""
+
+    def __init__(self, name=''):
+        self._name = name
+
+    def objectName(self):
+        return self._name
+
+
 class DummyApp:
     """A dummy application for testing theme functionality."""
 
     def __init__(self, already_dark_theme=False):
         self._palette = DummyPalette(already_dark_theme)
+        self._style = DummyStyle()
+        self._stylesheet = ''
+        self.set_style_calls = 0
+        self.set_stylesheet_calls = 0
+        self.set_palette_calls = 0
 
     def setStyle(self, style):
-        pass
+        self.set_style_calls += 1
+        self._style = DummyStyle(style.lower()) if isinstance(style, str) else style
 
     def setStyleSheet(self, stylesheet):
-        pass
+        self.set_stylesheet_calls += 1
+        self._stylesheet = stylesheet
+
+    def styleSheet(self):
+        return self._stylesheet
 
     def palette(self):
-        return self._palette
+        # Like QApplication.palette(), return a copy
+        return QtGui.QPalette(self._palette)
 
     def setPalette(self, palette):
+        self.set_palette_calls += 1
         self._palette = palette
 
     def style(self):
-        return None
+        return self._style
 
 
 @pytest.fixture
@@ -120,6 +142,7 @@ def test_gsettings_detection(key: str, stdout: str, expected: bool) -> None:
     [
         FileNotFoundError(),
         subprocess.CalledProcessError(1, "gsettings"),
+        subprocess.TimeoutExpired("gsettings", theme_detect.SUBPROCESS_TIMEOUT),
     ],
 )
 def test_gsettings_get_failure(side_effect) -> None:
@@ -261,6 +284,7 @@ def test_xfce_dark_theme_detection(stdout: str, expected: bool) -> None:
     [
         FileNotFoundError(),
         subprocess.CalledProcessError(1, "xfconf-query"),
+        subprocess.TimeoutExpired("xfconf-query", theme_detect.SUBPROCESS_TIMEOUT),
     ],
 )
 def test_xfce_dark_theme_detection_failure(side_effect) -> None:
@@ -335,6 +359,7 @@ def test_freedesktop_color_scheme_detection(gsettings_value: str, expected: bool
     [
         FileNotFoundError(),
         subprocess.CalledProcessError(1, "gsettings"),
+        subprocess.TimeoutExpired("gsettings", theme_detect.SUBPROCESS_TIMEOUT),
     ],
 )
 def test_freedesktop_color_scheme_detection_failure(side_effect) -> None:
@@ -449,7 +474,7 @@ def test_linux_dark_theme_palette(monkeypatch, already_dark_theme, dark_mode, ex
     config_mock.setting = {"ui_theme": "system"}
     monkeypatch.setattr(theme_mod, "get_config", lambda: config_mock)
     # Patch _detect_linux_dark_mode to return dark_mode
-    theme = theme_mod.BaseTheme()
+    theme = theme_mod.LinuxTheme()
     theme._detect_linux_dark_mode = lambda: dark_mode
 
     # Mock app and palette
@@ -626,7 +651,7 @@ def test_linux_dark_palette_override_only_if_not_already_dark(
     monkeypatch.setattr(theme_mod, "get_config", lambda: config_mock)
 
     app = DummyApp(already_dark_theme)
-    theme = theme_mod.BaseTheme()
+    theme = theme_mod.LinuxTheme()
     theme._detect_linux_dark_mode = lambda: linux_dark_mode_detected
     theme.setup(app)
     palette = app._palette
@@ -638,3 +663,114 @@ def test_linux_dark_palette_override_only_if_not_already_dark(
         assert window_color == QtGui.QColor(123, 123, 123), (
             f"Palette should not be overridden, got {window_color.getRgb()}"
         )
+
+
+def test_detect_linux_dark_mode_cached(monkeypatch):
+    strategy = Mock(return_value=True)
+    monkeypatch.setattr(theme_mod, "get_linux_dark_mode_strategies", lambda: [strategy])
+    theme_mod.invalidate_dark_mode_cache()
+    try:
+        theme = theme_mod.LinuxTheme()
+        assert theme._detect_linux_dark_mode() is True
+        assert theme._detect_linux_dark_mode() is True
+        strategy.assert_called_once()
+        theme_mod.invalidate_dark_mode_cache()
+        strategy.return_value = False
+        assert theme._detect_linux_dark_mode() is False
+        assert strategy.call_count == 2
+    finally:
+        theme_mod.invalidate_dark_mode_cache()
+
+
+def test_windows_theme_registry_read_once(monkeypatch):
+    class DummyKey:
+        def __enter__(self):
+            return self
+
+        def __exit__(self, exc_type, exc_val, exc_tb):
+            pass
+
+    values = {"AppsUseLightTheme": 0, "ColorizationColor": 0xC4123456}
+    winreg_mock = types.SimpleNamespace(
+        HKEY_CURRENT_USER=0,
+        OpenKey=Mock(return_value=DummyKey()),
+        QueryValueEx=Mock(side_effect=lambda key, value: (values[value],)),
+    )
+    monkeypatch.setattr(theme_mod, "winreg", winreg_mock)
+    config_mock = MagicMock()
+    config_mock.setting = {"ui_theme": "default"}
+    monkeypatch.setattr(theme_mod, "get_config", lambda: config_mock)
+
+    theme = theme_mod.WindowsTheme()
+    app = DummyApp()
+    theme.setup(app)
+    assert theme.is_dark_theme is True
+    assert theme.accent_color == QtGui.QColor(0x12, 0x34, 0x56)
+    assert winreg_mock.QueryValueEx.call_count == 2
+
+    # setup() reads the registry again
+    values["AppsUseLightTheme"] = 1
+    theme.setup(app)
+    assert theme.is_dark_theme is False
+    assert winreg_mock.QueryValueEx.call_count == 4
+    # Fusion style is only set once
+    assert app.set_style_calls == 1
+
+
+def test_os_supports_themes_alias():
+    assert theme_mod.OS_SUPPORTS_THEMES is theme_mod.os_supports_themes()
+    with pytest.raises(AttributeError):
+        theme_mod.NOT_AN_ATTRIBUTE  # noqa: B018
+
+
+def test_parse_ui_theme():
+    assert theme_mod._parse_ui_theme('dark') is theme_mod.UiTheme.DARK
+    assert theme_mod._parse_ui_theme('system') is theme_mod.UiTheme.SYSTEM
+    assert theme_mod._parse_ui_theme('invalid') is theme_mod.UiTheme.DEFAULT
+
+
+def test_setup_skips_unchanged_style_and_palette(monkeypatch):
+    config_mock = MagicMock()
+    config_mock.setting = {"ui_theme": "dark"}
+    monkeypatch.setattr(theme_mod, "get_config", lambda: config_mock)
+    # Dark base palette, its highlight color gets applied as accent color
+    app = DummyApp(already_dark_theme=True)
+    theme = theme_mod.BaseTheme()
+
+    theme.setup(app)
+    assert app.set_style_calls == 1
+    assert app.set_stylesheet_calls == 1
+    assert app.set_palette_calls == 1
+
+    theme.setup(app)
+    assert app.set_style_calls == 1
+    assert app.set_stylesheet_calls == 1
+    assert app.set_palette_calls == 1
+
+
+@pytest.mark.parametrize(
+    ("accent_color", "expected_text_color"),
+    [
+        (QtGui.QColor(0, 0, 255), QtCore.Qt.GlobalColor.white),
+        (QtGui.QColor(255, 255, 0), QtCore.Qt.GlobalColor.black),
+        (QtGui.QColor(160, 160, 160), QtCore.Qt.GlobalColor.black),
+        (QtGui.QColor(159, 159, 159), QtCore.Qt.GlobalColor.white),
+    ],
+)
+def test_update_palette_accent_text_color(accent_color, expected_text_color):
+    palette = QtGui.QPalette()
+    theme_mod.BaseTheme().update_palette(palette, False, accent_color)
+    text_color = palette.color(QtGui.QPalette.ColorGroup.Active, QtGui.QPalette.ColorRole.HighlightedText)
+    assert text_color == QtGui.QColor(expected_text_color)
+
+
+@pytest.mark.parametrize(("ui_theme", "expected_dark"), [("dark", True), ("light", False)])
+def test_setup_forced_theme_skips_detection(monkeypatch, ui_theme, expected_dark):
+    config_mock = MagicMock()
+    config_mock.setting = {"ui_theme": ui_theme}
+    monkeypatch.setattr(theme_mod, "get_config", lambda: config_mock)
+    theme = theme_mod.LinuxTheme()
+    theme._update_dark_theme = Mock()
+    theme.setup(DummyApp())
+    theme._update_dark_theme.assert_not_called()
+    assert theme.is_dark_theme is expected_dark
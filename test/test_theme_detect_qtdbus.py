@@ -542,6 +542,35 @@ class TestServiceAvailability:
             result = detector._is_service_available("org.freedesktop.portal.Desktop")
             assert result is False
 
+    def test_is_service_available_lists_names_once(self) -> None:
+        """Test the available services are only listed once."""
+        with (
+            patch("picard.ui.theme_detect_qtdbus.QDBusConnection") as mock_qdbus_connection,
+            patch("picard.ui.theme_detect_qtdbus.QDBusInterface") as mock_qdbus_interface,
+        ):
+            mock_connection = Mock()
+            mock_connection.isConnected.return_value = True
+            mock_qdbus_connection.sessionBus.return_value = mock_connection
+
+            mock_db_interface = Mock()
+            mock_db_message = Mock()
+            mock_db_message.type.return_value = QDBusMessage.MessageType.ReplyMessage
+            mock_db_message.arguments.return_value = [["org.freedesktop.portal.Desktop", "ca.desrt.dconf"]]
+            mock_db_interface.call.return_value = mock_db_message
+
+            def qdbus_interface_side_effect(*args, **kwargs):
+                if "org.freedesktop.DBus" in args:
+                    return mock_db_interface
+                return Mock()
+
+            mock_qdbus_interface.side_effect = qdbus_interface_side_effect
+
+            detector = DBusThemeDetector()
+            assert detector._is_service_available("org.freedesktop.portal.Desktop") is True
+            assert detector._is_service_available("ca.desrt.dconf") is True
+            assert detector._is_service_available("org.example.Missing") is False
+            mock_db_interface.call.assert_called_once_with("ListNames")
+
 
 class TestGlobalFunctions:
     """Test the global functions."""